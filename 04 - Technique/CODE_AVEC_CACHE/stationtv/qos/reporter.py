@@ -3,12 +3,14 @@ Station TV - QoS Reporter
 Génération de rapports et graphiques de performance
 """
 
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import seaborn as sns
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -16,6 +18,113 @@ logger = get_logger(__name__)
 # Style des graphiques
 sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 6)
+plt.rcParams['agg.path.chunksize'] = 10000  # Rendu par blocs des longues séries
+
+
+# Séparateurs du rapport texte
+_EQ_LINE = "=" * 80 + "\n"
+_DASH_LINE = "-" * 80 + "\n"
+
+# Verdicts QoS, indexés par le nombre de seuils de throughput atteints (1×, 5×)
+_THROUGHPUT_MSGS = (
+    "✗ Throughput insuffisant\n",
+    "✓ Throughput ≥ 1× (modèle medium) : ATTEINT\n",
+    "✓ Throughput ≥ 5× (modèle small) : ATTEINT\n",
+)
+_SUCCESS_OK = "✓ Taux de réussite ≥ 99% : ATTEINT\n"
+
+# Nombre max de points tracés par courbe (> 2× la largeur en pixels à 120 dpi)
+MAX_PLOT_POINTS = 4000
+
+
+def _downsample(values, target: int = MAX_PLOT_POINTS):
+    """
+    Réduit une série par pas régulier pour le tracé.
+    
+    Args:
+        values: Tableau numpy à réduire
+        target: Nombre maximal de points conservés
+    
+    Returns:
+        La série inchangée si assez courte, sinon un échantillon sur n
+    """
+    if len(values) <= target:
+        return values
+    step = -(-len(values) // target)
+    return values[::step]
+
+
+def _render_summary_report(metrics_summary: Dict) -> str:
+    """
+    Construit le texte du rapport de synthèse QoS.
+    
+    Args:
+        metrics_summary: Dictionnaire de métriques (depuis MetricsCalculator)
+    
+    Returns:
+        Contenu complet du rapport
+    """
+    # Métriques utilisées dans le rapport
+    session_hours = metrics_summary.get('session_duration_hours', 0)
+    total_files = metrics_summary.get('total_files', 0)
+    successful_files = metrics_summary.get('successful_files', 0)
+    failed_files = metrics_summary.get('failed_files', 0)
+    success_rate = metrics_summary.get('success_rate', 0)
+    audio_hours = metrics_summary.get('total_audio_duration_hours', 0)
+    processing_hours = metrics_summary.get('total_processing_time_hours', 0)
+    throughput = metrics_summary.get('throughput', 0)
+    avg_processing_seconds = metrics_summary.get('average_processing_time_seconds', 0)
+    success_pct = f"{success_rate * 100:.1f}%"
+    
+    parts = []
+    parts.append(_EQ_LINE)
+    parts.append("RAPPORT QoS - STATION TV - TRANSCRIPTION AUDIO\n")
+    parts.append(_EQ_LINE)
+    parts.append("\n")
+    
+    parts.append("RÉSUMÉ DE LA SESSION\n")
+    parts.append(_DASH_LINE)
+    parts.append(f"Durée de la session: {session_hours:.2f} heures\n")
+    parts.append(f"Nombre total de fichiers: {total_files}\n")
+    parts.append(f"Fichiers réussis: {successful_files}\n")
+    parts.append(f"Fichiers échoués: {failed_files}\n")
+    parts.append(f"Taux de réussite: {success_pct}\n\n")
+    
+    parts.append("PERFORMANCE\n")
+    parts.append(_DASH_LINE)
+    parts.append(f"Durée audio totale traitée: {audio_hours:.2f} heures\n")
+    parts.append(f"Temps de traitement total: {processing_hours:.2f} heures\n")
+    parts.append(f"Throughput (débit): {throughput:.2f}× temps réel\n")
+    parts.append(f"Temps moyen par fichier: {avg_processing_seconds:.2f} secondes\n\n")
+    
+    parts.append("OBJECTIFS QoS\n")
+    parts.append(_DASH_LINE)
+    # int() : avec un scalaire numpy, np.bool_ + np.bool_ est un OU logique
+    parts.append(_THROUGHPUT_MSGS[int(throughput >= 1) + int(throughput >= 5)])
+    parts.append(
+        _SUCCESS_OK if success_rate >= 0.99
+        else f"⚠ Taux de réussite {success_pct} < 99%\n"
+    )
+    
+    parts.append("\n")
+    parts.append(_EQ_LINE)
+    
+    return "".join(parts)
+
+
+@lru_cache(maxsize=32)
+def _render_summary_report_cached(metrics_key: tuple) -> str:
+    """
+    Version mémoïsée de _render_summary_report.
+    
+    Args:
+        metrics_key: Tuple trié de (clé, type, valeur) ; le type évite de
+            confondre 1 et 1.0, qui ont le même hash mais pas le même rendu
+    
+    Returns:
+        Contenu complet du rapport
+    """
+    return _render_summary_report({key: value for key, _, value in metrics_key})
 
 
 class QoSReporter:
@@ -35,6 +144,23 @@ class QoSReporter:
         
         logger.info(f"QoSReporter initialisé (output_dir={output_dir})")
     
+    def _read_metrics_csv(self, csv_file: str, columns: List[str]) -> "pd.DataFrame":
+        """
+        Lit uniquement les colonnes utiles d'un CSV de monitoring, en float32.
+        
+        Args:
+            csv_file: Fichier CSV de monitoring
+            columns: Colonnes numériques à charger (les colonnes absentes sont ignorées)
+        
+        Returns:
+            DataFrame restreint aux colonnes demandées
+        """
+        return pd.read_csv(
+            csv_file,
+            usecols=lambda col: col in columns,
+            dtype={col: 'float32' for col in columns}
+        )
+    
     def plot_cpu_usage(
         self, 
         cpu_csv_file: str, 
@@ -52,16 +178,21 @@ class QoSReporter:
         """
         try:
             # Lire les données
-            df = pd.read_csv(cpu_csv_file)
+            df = self._read_metrics_csv(cpu_csv_file, ['CPU_Usage_Percent'])
             
             if df.empty:
                 logger.warning("Fichier CPU vide")
                 return False
             
+            # Séries en tableaux numpy contigus
+            x = np.arange(len(df), dtype=np.int32)
+            cpu = df['CPU_Usage_Percent'].to_numpy(dtype=np.float32, copy=False)
+            
             # Créer le graphique
             plt.figure(figsize=(14, 6))
-            plt.plot(range(len(df)), df['CPU_Usage_Percent'], color='#2E86AB', linewidth=1.5)
-            plt.fill_between(range(len(df)), df['CPU_Usage_Percent'], alpha=0.3, color='#2E86AB')
+            x_plot, cpu_plot = _downsample(x), _downsample(cpu)
+            plt.plot(x_plot, cpu_plot, color='#2E86AB', linewidth=1.5)
+            plt.fill_between(x_plot, cpu_plot, alpha=0.3, color='#2E86AB')
             
             plt.title('Utilisation CPU - Station TV', fontsize=16, fontweight='bold')
             plt.xlabel('Temps (échantillons)', fontsize=12)
@@ -69,9 +200,9 @@ class QoSReporter:
             plt.ylim(0, 100)
             plt.grid(True, alpha=0.3)
             
-            # Ajouter des statistiques
-            mean_cpu = df['CPU_Usage_Percent'].mean()
-            max_cpu = df['CPU_Usage_Percent'].max()
+            # Ajouter des statistiques (nan* : ignore une dernière ligne incomplète)
+            mean_cpu = np.nanmean(cpu)
+            max_cpu = np.nanmax(cpu)
             plt.axhline(y=mean_cpu, color='red', linestyle='--', label=f'Moyenne: {mean_cpu:.1f}%')
             plt.legend()
             
@@ -80,7 +211,7 @@ class QoSReporter:
                 output_file = self.output_dir / "cpu_usage.png"
             
             plt.tight_layout()
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
+            plt.savefig(output_file, dpi=120)
             plt.close()
             
             logger.info(f"Graphique CPU généré: {output_file}")
@@ -109,35 +240,45 @@ class QoSReporter:
         """
         try:
             # Lire les données
-            df = pd.read_csv(memory_csv_file)
+            df = self._read_metrics_csv(
+                memory_csv_file,
+                ['Memory_Usage_Percent', 'Memory_Used_GB', 'Memory_Total_GB']
+            )
             
             if df.empty:
                 logger.warning("Fichier RAM vide")
                 return False
             
+            # Séries en tableaux numpy contigus
+            x = np.arange(len(df), dtype=np.int32)
+            mem_pct = df['Memory_Usage_Percent'].to_numpy(dtype=np.float32, copy=False)
+            
             # Créer le graphique
             fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
             
             # Graphique 1: Pourcentage
-            ax1.plot(range(len(df)), df['Memory_Usage_Percent'], color='#A23B72', linewidth=1.5)
-            ax1.fill_between(range(len(df)), df['Memory_Usage_Percent'], alpha=0.3, color='#A23B72')
+            x_plot, mem_pct_plot = _downsample(x), _downsample(mem_pct)
+            ax1.plot(x_plot, mem_pct_plot, color='#A23B72', linewidth=1.5)
+            ax1.fill_between(x_plot, mem_pct_plot, alpha=0.3, color='#A23B72')
             ax1.set_title('Utilisation RAM (%) - Station TV', fontsize=14, fontweight='bold')
             ax1.set_xlabel('Temps (échantillons)', fontsize=11)
             ax1.set_ylabel('Utilisation RAM (%)', fontsize=11)
             ax1.set_ylim(0, 100)
             ax1.grid(True, alpha=0.3)
             
-            mean_mem = df['Memory_Usage_Percent'].mean()
-            max_mem = df['Memory_Usage_Percent'].max()
+            mean_mem = np.nanmean(mem_pct)
+            max_mem = np.nanmax(mem_pct)
             ax1.axhline(y=mean_mem, color='red', linestyle='--', label=f'Moyenne: {mean_mem:.1f}%')
             ax1.axhline(y=90, color='orange', linestyle=':', label='Seuil alerte: 90%')
             ax1.legend()
             
             # Graphique 2: Valeurs absolues (Go)
             if 'Memory_Used_GB' in df.columns and 'Memory_Total_GB' in df.columns:
-                ax2.plot(range(len(df)), df['Memory_Used_GB'], color='#F18F01', linewidth=1.5, label='RAM utilisée')
-                ax2.axhline(y=df['Memory_Total_GB'].iloc[0], color='gray', linestyle='--', label=f"RAM totale: {df['Memory_Total_GB'].iloc[0]:.1f} Go")
-                ax2.fill_between(range(len(df)), df['Memory_Used_GB'], alpha=0.3, color='#F18F01')
+                mem_gb = _downsample(df['Memory_Used_GB'].to_numpy(dtype=np.float32, copy=False))
+                total_gb = df['Memory_Total_GB'].iloc[0]
+                ax2.plot(x_plot, mem_gb, color='#F18F01', linewidth=1.5, label='RAM utilisée')
+                ax2.axhline(y=total_gb, color='gray', linestyle='--', label=f"RAM totale: {total_gb:.1f} Go")
+                ax2.fill_between(x_plot, mem_gb, alpha=0.3, color='#F18F01')
                 ax2.set_title('Utilisation RAM (Go) - Station TV', fontsize=14, fontweight='bold')
                 ax2.set_xlabel('Temps (échantillons)', fontsize=11)
                 ax2.set_ylabel('RAM utilisée (Go)', fontsize=11)
@@ -149,7 +290,7 @@ class QoSReporter:
                 output_file = self.output_dir / "memory_usage.png"
             
             plt.tight_layout()
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
+            plt.savefig(output_file, dpi=120)
             plt.close()
             
             logger.info(f"Graphique RAM généré: {output_file}")
@@ -176,56 +317,34 @@ class QoSReporter:
         Returns:
             True si succès, False sinon
         """
+        if output_file is None:
+            output_file = self.output_dir / "summary_report.txt"
+        
+        # Rendu mémoïsé quand toutes les valeurs sont hachables
+        try:
+            metrics_key = tuple(sorted(
+                (key, type(value), value) for key, value in metrics_summary.items()
+            ))
+            hash(metrics_key)
+        except TypeError:
+            metrics_key = None
+        
+        if metrics_key is not None:
+            report = _render_summary_report_cached(metrics_key)
+        else:
+            report = _render_summary_report(metrics_summary)
+        
+        # Seule l'écriture sur disque peut échouer
         try:
-            if output_file is None:
-                output_file = self.output_dir / "summary_report.txt"
-            
             Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-            
             with open(output_file, 'w', encoding='utf-8') as f:
-                f.write("=" * 80 + "\n")
-                f.write("RAPPORT QoS - STATION TV - TRANSCRIPTION AUDIO\n")
-                f.write("=" * 80 + "\n\n")
-                
-                f.write("RÉSUMÉ DE LA SESSION\n")
-                f.write("-" * 80 + "\n")
-                f.write(f"Durée de la session: {metrics_summary.get('session_duration_hours', 0):.2f} heures\n")
-                f.write(f"Nombre total de fichiers: {metrics_summary.get('total_files', 0)}\n")
-                f.write(f"Fichiers réussis: {metrics_summary.get('successful_files', 0)}\n")
-                f.write(f"Fichiers échoués: {metrics_summary.get('failed_files', 0)}\n")
-                f.write(f"Taux de réussite: {metrics_summary.get('success_rate', 0)*100:.1f}%\n\n")
-                
-                f.write("PERFORMANCE\n")
-                f.write("-" * 80 + "\n")
-                f.write(f"Durée audio totale traitée: {metrics_summary.get('total_audio_duration_hours', 0):.2f} heures\n")
-                f.write(f"Temps de traitement total: {metrics_summary.get('total_processing_time_hours', 0):.2f} heures\n")
-                f.write(f"Throughput (débit): {metrics_summary.get('throughput', 0):.2f}× temps réel\n")
-                f.write(f"Temps moyen par fichier: {metrics_summary.get('average_processing_time_seconds', 0):.2f} secondes\n\n")
-                
-                f.write("OBJECTIFS QoS\n")
-                f.write("-" * 80 + "\n")
-                throughput = metrics_summary.get('throughput', 0)
-                if throughput >= 5:
-                    f.write("✓ Throughput ≥ 5× (modèle small) : ATTEINT\n")
-                elif throughput >= 1:
-                    f.write("✓ Throughput ≥ 1× (modèle medium) : ATTEINT\n")
-                else:
-                    f.write("✗ Throughput insuffisant\n")
-                
-                success_rate = metrics_summary.get('success_rate', 0)
-                if success_rate >= 0.99:
-                    f.write("✓ Taux de réussite ≥ 99% : ATTEINT\n")
-                else:
-                    f.write(f"⚠ Taux de réussite {success_rate*100:.1f}% < 99%\n")
-                
-                f.write("\n" + "=" * 80 + "\n")
-            
-            logger.info(f"Rapport de synthèse généré: {output_file}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Erreur lors de la génération du rapport: {str(e)}")
+                f.write(report)
+        except OSError as e:
+            logger.error(f"Erreur lors de l'écriture du rapport: {str(e)}")
             return False
+        
+        logger.info(f"Rapport de synthèse généré: {output_file}")
+        return True
     
     def plot_power_usage(self, csv_file: str) -> str:
         """
@@ -307,7 +426,7 @@ class QoSReporter:
             
             # Sauvegarder
             output_file = Path(self.output_dir) / "power_usage.png"
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
+            plt.savefig(output_file, dpi=120)
             plt.close()
             
             logger.info(f"Graphique énergétique généré: {output_file}")
@@ -333,33 +452,44 @@ class QoSReporter:
             True si succès, False sinon
         """
         try:
-            df = pd.read_csv(io_csv_file)
+            df = self._read_metrics_csv(
+                io_csv_file,
+                ['IO_Usage_Percent', 'Read_MB_s', 'Write_MB_s']
+            )
             
             if df.empty:
                 logger.warning("Fichier I/O vide")
                 return False
             
+            # Séries en tableaux numpy contigus
+            x = np.arange(len(df), dtype=np.int32)
+            io_pct = df['IO_Usage_Percent'].to_numpy(dtype=np.float32, copy=False)
+            read_mb = df['Read_MB_s'].to_numpy(dtype=np.float32, copy=False)
+            write_mb = df['Write_MB_s'].to_numpy(dtype=np.float32, copy=False)
+            
             fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
             
             # Graphique 1: Pourcentage I/O
-            ax1.plot(range(len(df)), df['IO_Usage_Percent'], color='#E85D04', linewidth=1.5)
-            ax1.fill_between(range(len(df)), df['IO_Usage_Percent'], alpha=0.3, color='#E85D04')
+            x_plot, io_pct_plot = _downsample(x), _downsample(io_pct)
+            ax1.plot(x_plot, io_pct_plot, color='#E85D04', linewidth=1.5)
+            ax1.fill_between(x_plot, io_pct_plot, alpha=0.3, color='#E85D04')
             ax1.set_title('Utilisation I/O Disque (%) - Station TV', fontsize=14, fontweight='bold')
             ax1.set_xlabel('Temps (échantillons)', fontsize=11)
             ax1.set_ylabel('Utilisation I/O (%)', fontsize=11)
             ax1.set_ylim(0, 100)
             ax1.grid(True, alpha=0.3)
             
-            mean_io = df['IO_Usage_Percent'].mean()
-            max_io = df['IO_Usage_Percent'].max()
+            mean_io = np.nanmean(io_pct)
+            max_io = np.nanmax(io_pct)
             ax1.axhline(y=mean_io, color='red', linestyle='--', label=f'Moyenne: {mean_io:.1f}%')
             ax1.legend()
             
             # Graphique 2: Débit lecture/écriture (MB/s)
-            ax2.plot(range(len(df)), df['Read_MB_s'], color='#2196F3', linewidth=1.5, label='Lecture (MB/s)')
-            ax2.plot(range(len(df)), df['Write_MB_s'], color='#FF5722', linewidth=1.5, label='Écriture (MB/s)')
-            ax2.fill_between(range(len(df)), df['Read_MB_s'], alpha=0.2, color='#2196F3')
-            ax2.fill_between(range(len(df)), df['Write_MB_s'], alpha=0.2, color='#FF5722')
+            read_mb, write_mb = _downsample(read_mb), _downsample(write_mb)
+            ax2.plot(x_plot, read_mb, color='#2196F3', linewidth=1.5, label='Lecture (MB/s)')
+            ax2.plot(x_plot, write_mb, color='#FF5722', linewidth=1.5, label='Écriture (MB/s)')
+            ax2.fill_between(x_plot, read_mb, alpha=0.2, color='#2196F3')
+            ax2.fill_between(x_plot, write_mb, alpha=0.2, color='#FF5722')
             ax2.set_title('Débit I/O (MB/s) - Station TV', fontsize=14, fontweight='bold')
             ax2.set_xlabel('Temps (échantillons)', fontsize=11)
             ax2.set_ylabel('Débit (MB/s)', fontsize=11)
@@ -370,7 +500,7 @@ class QoSReporter:
                 output_file = self.output_dir / "io_usage.png"
             
             plt.tight_layout()
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
+            plt.savefig(output_file, dpi=120)
             plt.close()
             
             logger.info(f"Graphique I/O généré: {output_file}")
@@ -106,8 +106,13 @@ def check_audio_files(bdd_dir: str):
         logger.warning(f"  ⚠️ Répertoire {bdd_dir} n'existe pas")
         return False
     
-    # Chercher les fichiers de test
-    test_files = list(path.glob("test_*.mp3")) + list(path.glob("test_*.wav"))
+    # Chercher les fichiers de test (un seul parcours du répertoire,
+    # insensible à la casse comme glob sous Windows, mp3 puis wav)
+    entries = [f for f in path.iterdir() if f.name.lower().startswith("test_")]
+    test_files = [
+        f for suffix in ('.mp3', '.wav') for f in entries
+        if f.suffix.lower() == suffix
+    ]
     
     if test_files:
         logger.info(f"  ✓ {len(test_files)} fichier(s) de test trouvé(s)")
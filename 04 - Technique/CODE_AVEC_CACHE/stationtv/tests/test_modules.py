@@ -532,6 +532,23 @@ class TestQoSReporter(unittest.TestCase):
         png_file = os.path.join(self.tmpdir, "cpu_usage.png")
         self.assertTrue(os.path.exists(png_file))
     
+    def test_plot_cpu_usage_blank_cell(self):
+        """Vérifie que les statistiques CPU ignorent une cellule vide (ligne en cours d'écriture)"""
+        reporter = self.QoSReporter(output_dir=self.tmpdir)
+        csv_path = os.path.join(self.tmpdir, "monitoring_cpu.csv")
+        with open(csv_path, 'w', newline='') as f:
+            f.write("Timestamp,CPU_Usage_Percent\n")
+            f.write("2026-02-16 14:00:00,10.00\n")
+            f.write("2026-02-16 14:01:00,20.00\n")
+            f.write("2026-02-16 14:02:00,\n")
+        
+        with self.assertLogs('qos.reporter', level='INFO') as logs:
+            self.assertTrue(reporter.plot_cpu_usage(csv_path))
+        
+        output = "\n".join(logs.output)
+        self.assertIn("CPU moyen: 15.0%, CPU max: 20.0%", output)
+        self.assertNotIn("nan", output)
+    
     def test_plot_memory_usage(self):
         """Vérifie la génération du graphique RAM"""
         reporter = self.QoSReporter(output_dir=self.tmpdir)
@@ -554,6 +571,34 @@ class TestQoSReporter(unittest.TestCase):
         png_file = os.path.join(self.tmpdir, "io_usage.png")
         self.assertTrue(os.path.exists(png_file))
     
+    def test_read_metrics_csv_columns(self):
+        """Vérifie que seules les colonnes demandées sont chargées, en float32"""
+        reporter = self.QoSReporter(output_dir=self.tmpdir)
+        csv_path = self._create_io_csv()
+        
+        df = reporter._read_metrics_csv(csv_path, ['IO_Usage_Percent', 'Absente'])
+        self.assertEqual(list(df.columns), ['IO_Usage_Percent'])
+        self.assertEqual(str(df['IO_Usage_Percent'].dtype), 'float32')
+        self.assertEqual(len(df), 10)
+    
+    def test_downsample(self):
+        """Vérifie la réduction des longues séries avant tracé"""
+        import numpy as np
+        from qos.reporter import _downsample
+        
+        short = np.arange(100, dtype=np.float32)
+        self.assertIs(_downsample(short, target=100), short)
+        
+        # Longueur non multiple de target : x et y doivent rester alignés
+        x = np.arange(10001, dtype=np.int32)
+        y = np.arange(10001, dtype=np.float32) * 0.5
+        x_plot, y_plot = _downsample(x, target=1000), _downsample(y, target=1000)
+        self.assertIsInstance(x_plot, np.ndarray)
+        self.assertLessEqual(len(x_plot), 1000)
+        self.assertEqual(len(x_plot), len(y_plot))
+        self.assertEqual(x_plot[0], 0)
+        np.testing.assert_array_equal(y_plot, x_plot * 0.5)
+    
     def test_generate_summary_report(self):
         """Vérifie la génération du rapport résumé"""
         reporter = self.QoSReporter(output_dir=self.tmpdir)
@@ -572,6 +617,119 @@ class TestQoSReporter(unittest.TestCase):
         
         result = reporter.generate_summary_report(metrics_summary)
         self.assertTrue(result)
+    
+    def test_generate_summary_report_content(self):
+        """Vérifie le contenu du rapport résumé"""
+        reporter = self.QoSReporter(output_dir=self.tmpdir)
+        
+        metrics_summary = {
+            "total_files": 24,
+            "failed_files": 2,
+            "throughput": 1.5,
+            "success_rate": 0.917,
+        }
+        
+        self.assertTrue(reporter.generate_summary_report(metrics_summary))
+        with open(os.path.join(self.tmpdir, "summary_report.txt"), encoding='utf-8') as f:
+            content = f.read()
+        
+        self.assertTrue(content.startswith("=" * 80 + "\n"))
+        self.assertIn("Nombre total de fichiers: 24\n", content)
+        self.assertIn("Fichiers échoués: 2\n", content)
+        self.assertIn("Throughput (débit): 1.50× temps réel\n", content)
+        self.assertIn("✓ Throughput ≥ 1× (modèle medium) : ATTEINT\n", content)
+        self.assertIn("⚠ Taux de réussite 91.7% < 99%\n", content)
+        self.assertTrue(content.endswith("\n" + "=" * 80 + "\n"))
+    
+    def test_generate_summary_report_throughput_tiers(self):
+        """Vérifie les trois verdicts de throughput, y compris avec des scalaires numpy"""
+        import numpy as np
+        reporter = self.QoSReporter(output_dir=self.tmpdir)
+        report_path = os.path.join(self.tmpdir, "summary_report.txt")
+        
+        expected = [
+            (0.5, "✗ Throughput insuffisant\n"),
+            (1.5, "✓ Throughput ≥ 1× (modèle medium) : ATTEINT\n"),
+            (6.0, "✓ Throughput ≥ 5× (modèle small) : ATTEINT\n"),
+        ]
+        for throughput, line in expected:
+            for value in (throughput, np.float64(throughput)):
+                with self.subTest(throughput=value, type=type(value).__name__):
+                    self.assertTrue(reporter.generate_summary_report(
+                        {"throughput": value, "success_rate": 1.0}
+                    ))
+                    with open(report_path, encoding='utf-8') as f:
+                        self.assertIn(line, f.read())
+    
+    def test_generate_summary_report_cache(self):
+        """Vérifie le rendu mémoïsé du rapport résumé (types et valeurs non hachables)"""
+        reporter = self.QoSReporter(output_dir=self.tmpdir)
+        report_path = os.path.join(self.tmpdir, "summary_report.txt")
+        
+        from qos.reporter import _render_summary_report_cached
+        _render_summary_report_cached.cache_clear()
+        
+        def render(metrics_summary):
+            self.assertTrue(reporter.generate_summary_report(metrics_summary))
+            with open(report_path, encoding='utf-8') as f:
+                return f.read()
+        
+        def cache_counts():
+            info = _render_summary_report_cached.cache_info()
+            return info.hits, info.misses
+        
+        # Deux résumés identiques : un rendu puis un succès de cache
+        first = render({"total_files": 1, "throughput": 2.0})
+        self.assertEqual(cache_counts(), (0, 1))
+        self.assertEqual(render({"throughput": 2.0, "total_files": 1}), first)
+        self.assertEqual(cache_counts(), (1, 1))
+        
+        # 1 et 1.0 ont le même hash mais pas le même rendu : entrées distinctes
+        self.assertIn("Nombre total de fichiers: 1\n", render({"total_files": 1}))
+        self.assertEqual(cache_counts(), (1, 2))
+        self.assertIn("Nombre total de fichiers: 1.0\n", render({"total_files": 1.0}))
+        self.assertEqual(cache_counts(), (1, 3))
+        
+        # Valeur non hachable : rendu sans cache
+        content = render({"total_files": 3, "files": ["a.mp3", "b.mp3"]})
+        self.assertIn("Nombre total de fichiers: 3\n", content)
+        self.assertEqual(cache_counts(), (1, 3))
+    
+    def test_generate_summary_report_numpy_metrics(self):
+        """Vérifie qu'un résumé en types numpy est rendu sans lever d'exception"""
+        import numpy as np
+        reporter = self.QoSReporter(output_dir=self.tmpdir)
+        
+        metrics_summary = {
+            "total_files": np.int64(24),
+            "successful_files": np.int64(22),
+            "failed_files": np.int64(2),
+            "success_rate": np.float64(0.917),
+            "throughput": np.float64(6.0),
+            "session_duration_hours": np.float32(5.0),
+            "total_audio_duration_hours": np.float64(24.0),
+            "total_processing_time_hours": np.float64(4.0),
+            "average_processing_time_seconds": np.float64(720.0),
+        }
+        
+        self.assertTrue(reporter.generate_summary_report(metrics_summary))
+        with open(os.path.join(self.tmpdir, "summary_report.txt"), encoding='utf-8') as f:
+            content = f.read()
+        self.assertIn("✓ Throughput ≥ 5× (modèle small) : ATTEINT\n", content)
+        self.assertIn("⚠ Taux de réussite 91.7% < 99%\n", content)
+    
+    def test_generate_summary_report_write_error(self):
+        """Vérifie qu'une erreur d'écriture renvoie False"""
+        reporter = self.QoSReporter(output_dir=self.tmpdir)
+        
+        # Le dossier parent est un fichier : l'écriture doit échouer
+        blocker = os.path.join(self.tmpdir, "bloquant")
+        Path(blocker).touch()
+        
+        result = reporter.generate_summary_report(
+            {"total_files": 1}, os.path.join(blocker, "summary_report.txt")
+        )
+        self.assertFalse(result)
 
 
 # ============================================================